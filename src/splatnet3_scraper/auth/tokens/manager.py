@@ -17,7 +17,27 @@ from splatnet3_scraper.constants import (
 logger = logging.getLogger(__name__)
 
 
+def _as_url_list(f_token_url: str | list[str] | None) -> list[str]:
+    """Normalizes the f token URL argument into a new list of URLs.
+
+    Args:
+        f_token_url (str | list[str] | None): A single URL, a list of URLs, or
+            None to use the default URLs.
+
+    Returns:
+        list[str]: The list of URLs. This is always a new list, so the default
+            URL list is never shared between managers.
+    """
+    if f_token_url is None:
+        return list(DEFAULT_F_TOKEN_URL)
+    elif isinstance(f_token_url, str):
+        return [f_token_url]
+    return list(f_token_url)
+
+
 class ManagerOrigin:
+    __slots__ = ("origin", "data")
+
     def __init__(self, origin: ORIGIN, data: str | None = None) -> None:
         self.origin = origin
         self.data = data
@@ -29,6 +49,8 @@ class TokenManager:
     "get" method
     """
 
+    __slots__ = ("nso", "f_token_url", "keychain", "_env_manager", "origin")
+
     def __init__(
         self,
         nso: NSO | None = None,
@@ -53,7 +75,8 @@ class TokenManager:
                 None.
             env_manager (EnvironmentVariablesManager | None): An instance of the
                 ``EnvironmentVariablesManager`` class. If one is not provided, a
-                new instance will be created. Defaults to None.
+                new instance will be created the first time it is needed.
+                Defaults to None.
             origin (ORIGIN): The origin of the tokens. Defaults to "memory". One
                 of "memory", "env", or "file".
             origin_data (str | None): The data associated with the origin. If
@@ -74,14 +97,32 @@ class TokenManager:
         except ValueError as e:
             raise e
 
-        if isinstance(f_token_url, str):
-            self.f_token_url = [f_token_url]
-        else:
-            self.f_token_url = f_token_url
-
-        self.env_manager = env_manager or EnvironmentVariablesManager()
+        self.f_token_url = _as_url_list(f_token_url)
+        self._env_manager = env_manager
         self.origin = ManagerOrigin(origin, origin_data)
 
+    @property
+    def env_manager(self) -> EnvironmentVariablesManager:
+        """The ``EnvironmentVariablesManager`` used by this manager. It is
+        created on first access if one was not provided.
+
+        Returns:
+            EnvironmentVariablesManager: The environment variables manager.
+        """
+        if self._env_manager is None:
+            self._env_manager = EnvironmentVariablesManager()
+        return self._env_manager
+
+    @env_manager.setter
+    def env_manager(self, env_manager: EnvironmentVariablesManager) -> None:
+        """Sets the ``EnvironmentVariablesManager`` used by this manager.
+
+        Args:
+            env_manager (EnvironmentVariablesManager): The environment
+                variables manager.
+        """
+        self._env_manager = env_manager
+
     def flag_origin(self, origin: ORIGIN, data: str | None = None) -> None:
         """Flags the origin of the token manager. This is used to identify where
         the token manager was loaded from, if anywhere. This is used to help
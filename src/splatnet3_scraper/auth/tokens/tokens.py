@@ -11,6 +11,8 @@ class Token:
     the token.
     """
 
+    __slots__ = ("value", "name", "timestamp", "expiration")
+
     def __init__(self, value: str, name: str, timestamp: float) -> None:
         """Initializes a ``Token`` object. The expiration time is calculated
         based on the token type, with a default of ``1e10`` seconds (about 316
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import configparser
+import io
 import json
+import os
+import tempfile
 from typing import TypeVar, cast
 
 from splatnet3_scraper.auth.tokens import TokenManager, TokenManagerConstructor
@@ -9,6 +11,7 @@ from splatnet3_scraper.constants import TOKENS
 from splatnet3_scraper.query.config.config_option_handler import (
     ConfigOptionHandler,
 )
+from splatnet3_scraper.query.config.fast_config_parser import FastConfigParser
 
 T = TypeVar("T")
 
@@ -25,8 +28,17 @@ class Config:
     class and more time spent making queries.
     """
 
+    __slots__ = (
+        "_token_manager",
+        "_output_file_path",
+        "handler",
+    )
+
     DEFAULT_CONFIG_PATH = ".splatnet3_scraper"
     DEFAULT_PREFIX = "SN3S"
+    TOKEN_OPTIONS = frozenset(
+        (TOKENS.SESSION_TOKEN, TOKENS.GTOKEN, TOKENS.BULLET_TOKEN)
+    )
 
     def __init__(
         self,
@@ -59,11 +71,11 @@ class Config:
         """Regenerates the tokens and updates the config."""
         self.token_manager.regenerate_tokens()
         # Add tokens to config
-        for token in [
+        for token in (
             TOKENS.SESSION_TOKEN,
             TOKENS.GTOKEN,
             TOKENS.BULLET_TOKEN,
-        ]:
+        ):
             self.handler.set_value(
                 token,
                 self.token_manager.get_token(token).value,
@@ -135,11 +147,7 @@ class Config:
             value (str | None): The value to set the option to.
         """
         self.handler.set_value(option, value)
-        if option in [
-            TOKENS.SESSION_TOKEN,
-            TOKENS.GTOKEN,
-            TOKENS.BULLET_TOKEN,
-        ]:
+        if option in self.TOKEN_OPTIONS:
             if (token := self.handler.tokens[option]) is not None:
                 self.token_manager.add_token(
                     token,
@@ -169,6 +177,7 @@ class Config:
             gtoken=gtoken,
             bullet_token=bullet_token,
             prefix=prefix,
+            handler=handler,
         )
 
     @staticmethod
@@ -178,6 +187,7 @@ class Config:
         bullet_token: str | None = None,
         *,
         prefix: str = "",
+        handler: ConfigOptionHandler | None = None,
     ) -> Config:
         """Creates a ``Config`` object from a session token and other tokens.
 
@@ -187,8 +197,11 @@ class Config:
                 gtoken will be generated.
             bullet_token (str | None): The bullet token to use. If None is
                 provided, a new bullet token will be generated.
-            prefix (str): The prefix to use for the config options. Defaults to
-                "SN3S".
+            prefix (str): The prefix to use for the config options. Only used
+                if a new handler is created. Defaults to "SN3S".
+            handler (ConfigOptionHandler | None): An existing
+                ``ConfigOptionHandler`` object to store the tokens in. If None,
+                a new one will be created. Defaults to None.
 
         Returns:
             Config: The ``Config`` object.
@@ -199,8 +212,9 @@ class Config:
             bullet_token=bullet_token,
         )
 
-        prefix = prefix or Config.DEFAULT_PREFIX
-        handler = ConfigOptionHandler(prefix=prefix)
+        if handler is None:
+            prefix = prefix or Config.DEFAULT_PREFIX
+            handler = ConfigOptionHandler(prefix=prefix)
         handler.set_value(TOKENS.SESSION_TOKEN, session_token)
         handler.set_value(TOKENS.GTOKEN, gtoken)
         handler.set_value(TOKENS.BULLET_TOKEN, bullet_token)
@@ -267,7 +281,7 @@ class Config:
             Config: The ``Config`` object created from the file.
         """
         prefix = prefix or Config.DEFAULT_PREFIX
-        cparse = configparser.ConfigParser()
+        cparse = FastConfigParser()
         cparse.read(file_path)
         handler = ConfigOptionHandler(prefix=prefix)
         handler.read_from_configparser(cparse)
@@ -276,6 +290,42 @@ class Config:
             output_file_path=file_path if save_to_file else None,
         )
 
+    @staticmethod
+    def _write_atomic(file_path: str, content: str) -> None:
+        """Writes a file atomically. The content is written in a single call
+        to a uniquely named temporary file next to the target, which then
+        replaces the target. Readers therefore never see a partially written
+        file. If the target is a symlink, the file it points to is replaced.
+        The permissions of an existing target file are applied before any
+        content is written; a new file is only readable by its owner.
+
+        Args:
+            file_path (str): The path to the file to write.
+            content (str): The full content of the file.
+        """
+        file_path = os.path.realpath(file_path)
+        try:
+            mode: int | None = os.stat(file_path).st_mode & 0o7777
+        except OSError:
+            mode = None
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path),
+            prefix=os.path.basename(file_path) + ".",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                if mode is not None:
+                    os.chmod(tmp_path, mode)
+                f.write(content)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
     @staticmethod
     def from_dict(
         config: dict[str, str],
@@ -298,7 +348,8 @@ class Config:
         return Config.from_config_handler(handler)
 
     def save_to_file(self, file_path: str | None = None) -> None:
-        """Saves the config to a file.
+        """Saves the config to a file. If the file already contains exactly the
+        config that would be written, it is left untouched.
 
         Args:
             file_path (str | None): The path to the file to save the config to.
@@ -311,9 +362,19 @@ class Config:
         file_path = file_path or self._output_file_path
         if file_path is None:
             raise ValueError("No file path provided.")
-        config = self.handler.save_to_configparser()
-        with open(file_path, "w") as f:
-            config.write(f)
+        config = self.handler.save_to_configparser(FastConfigParser())
+        buffer = io.StringIO()
+        config.write(buffer)
+        content = buffer.getvalue()
+        try:
+            with open(file_path, "r") as f:
+                if f.read() == content:
+                    return
+        except (OSError, UnicodeDecodeError):
+            # Missing or unreadable files are simply overwritten
+            pass
+
+        self._write_atomic(file_path, content)
 
     @staticmethod
     def from_s3s_config(
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import configparser
 import copy
+import itertools
+from typing import Iterable, Iterator
 
 from splatnet3_scraper.constants import (
     DEFAULT_F_TOKEN_URL,
@@ -15,6 +17,7 @@ from splatnet3_scraper.query.config.callbacks import (
     session_token_callback,
 )
 from splatnet3_scraper.query.config.config_option import ConfigOption
+from splatnet3_scraper.query.config.fast_config_parser import FastConfigParser
 
 
 class ConfigOptionHandler:
@@ -128,15 +131,18 @@ class ConfigOptionHandler:
         Returns:
             dict[str, ConfigOption]: The option reference dictionary.
         """
-        reference = {option.name: option for option in self.OPTIONS}
-        deprecated_reference = {}
-        for option in self.OPTIONS:
-            if isinstance(option.deprecated_names, str):
-                deprecated_reference[option.deprecated_names] = option
-                continue
-            for deprecated_name in option.deprecated_names or []:
+        reference: dict[str, ConfigOption] = {}
+        deprecated_reference: dict[str, ConfigOption] = {}
+        for option in self._iter_options():
+            reference[option.name] = option
+            deprecated_names = option.deprecated_names or []
+            if isinstance(deprecated_names, str):
+                deprecated_names = [deprecated_names]
+            for deprecated_name in deprecated_names:
                 deprecated_reference[deprecated_name] = option
-        return {**reference, **deprecated_reference}
+        # Deprecated names take precedence over current option names
+        reference.update(deprecated_reference)
+        return reference
 
     def assign_prefix_to_options(self, prefix: str) -> None:
         """Assigns a prefix to the options.
@@ -146,9 +152,18 @@ class ConfigOptionHandler:
         Args:
             prefix (str): The prefix to assign to the options.
         """
-        for option in self.OPTIONS:
+        for option in self._iter_options():
             option.set_prefix(prefix)
 
+    def _iter_options(self) -> Iterator[ConfigOption]:
+        """Iterates over the set options and any additional options that have
+        been added, without building an intermediate list.
+
+        Returns:
+            Iterator[ConfigOption]: An iterator over the options.
+        """
+        return itertools.chain(self._OPTIONS, self._ADDITIONAL_OPTIONS)
+
     @property
     def OPTIONS(self) -> list[ConfigOption]:
         """The list of options.
@@ -159,7 +174,7 @@ class ConfigOptionHandler:
         Returns:
             list[ConfigOption]: The list of options.
         """
-        return list(self._OPTIONS) + self._ADDITIONAL_OPTIONS
+        return list(self._iter_options())
 
     @property
     def SUPPORTED_OPTIONS(self) -> list[str]:
@@ -182,7 +197,7 @@ class ConfigOptionHandler:
         Returns:
             list[str]: The list of sections.
         """
-        return list(set(option.section for option in self.OPTIONS))
+        return list(set(option.section for option in self._iter_options()))
 
     @property
     def tokens(self) -> dict[str, str | None]:
@@ -212,7 +227,9 @@ class ConfigOptionHandler:
             self.assign_prefix_to_options(self.prefix)
 
     def get_option(self, name: str) -> ConfigOption:
-        """Gets an option from the option reference dictionary.
+        """Gets an option from the option reference dictionary. Names are case
+        insensitive; the name is only lowercased if it is not found as given,
+        so the common case of an already lowercase name is a single lookup.
 
         Args:
             name (str): The name of the option to get.
@@ -223,11 +240,13 @@ class ConfigOptionHandler:
         Returns:
             ConfigOption: The option that was retrieved.
         """
-        name = name.lower()
-        try:
-            return self.option_reference[name]
-        except KeyError:
-            raise KeyError(f"Option {name} is not supported.")
+        option = self.option_reference.get(name)
+        if option is None:
+            name = name.lower()
+            option = self.option_reference.get(name)
+            if option is None:
+                raise KeyError(f"Option {name} is not supported.")
+        return option
 
     def get_value(self, name: str) -> str | None:
         """Gets the value of an option.
@@ -258,23 +277,28 @@ class ConfigOptionHandler:
         Returns:
             list[ConfigOption]: The list of options in the section.
         """
-        return [option for option in self.OPTIONS if option.section == section]
-
-    def read_from_configparser(self, config: configparser.ConfigParser) -> None:
+        return [
+            option
+            for option in self._iter_options()
+            if option.section == section
+        ]
+
+    def read_from_configparser(
+        self, config: configparser.ConfigParser | FastConfigParser
+    ) -> None:
         """Reads the config from a ConfigParser object and sets the values in
-        the handler.
+        the handler. Values are read raw, so no interpolation is performed even
+        if a ``configparser.ConfigParser`` object is given.
 
         Args:
-            config (configparser.ConfigParser): The ConfigParser object to read
-                the config from.
+            config (configparser.ConfigParser | FastConfigParser): The
+                ConfigParser object to read the config from.
         """
-        for section in config.sections():
-            for option in config.options(section):
-                value = config.get(section, option)
-                try:
-                    self.set_value(option, value)
-                except KeyError:
-                    self.unknown_options.append((option, value))
+        self._read_items(
+            item
+            for section in config.sections()
+            for item in config.items(section, raw=True)
+        )
 
     def read_from_dict(self, config: dict[str, str]) -> None:
         """Reads the config from a dictionary and sets the values in the
@@ -283,39 +307,57 @@ class ConfigOptionHandler:
         Args:
             config (dict[str, str]): The dictionary to read the config from.
         """
-        for option, value in config.items():
-            try:
+        self._read_items(config.items())
+
+    def _read_items(self, items: Iterable[tuple[str, str]]) -> None:
+        """Sets the values of the given options. The option names are split
+        into supported and unknown names up front with a single set difference
+        against the option reference. Unknown options are stored in
+        ``unknown_options`` and the rest are set in the handler.
+
+        Args:
+            items (Iterable[tuple[str, str]]): The option name and value pairs.
+        """
+        items = list(items)
+        unknown = {
+            option.lower() for option, _ in items
+        } - self.option_reference.keys()
+        self.unknown_options.extend(
+            item for item in items if item[0].lower() in unknown
+        )
+        for option, value in items:
+            if option.lower() not in unknown:
                 self.set_value(option, value)
-            except KeyError:
-                self.unknown_options.append((option, value))
 
     def save_to_configparser(
-        self, config: configparser.ConfigParser | None = None
-    ) -> configparser.ConfigParser:
+        self, config: configparser.ConfigParser | FastConfigParser | None = None
+    ) -> configparser.ConfigParser | FastConfigParser:
         """Saves the config to a ConfigParser object.
 
         Args:
-            config (configparser.ConfigParser | None): The ConfigParser object
-                to save the config to. If None, a new ConfigParser object will
-                be created.
+            config (configparser.ConfigParser | FastConfigParser | None): The
+                ConfigParser object to save the config to. If None, a new
+                ``configparser.ConfigParser`` object will be created.
 
         Returns:
-            configparser.ConfigParser: The ConfigParser object with the config
-                saved to it.
+            configparser.ConfigParser | FastConfigParser: The ConfigParser
+                object with the config saved to it.
         """
         if config is None:
             config = configparser.ConfigParser()
-        for option in self.OPTIONS:
+        sections = set(config.sections())
+        for option in self._iter_options():
             if option.value is None:
                 continue
-            if not config.has_section(option.section):
+            if option.section not in sections:
                 config.add_section(option.section)
+                sections.add(option.section)
             if option.save_callback is not None:
                 config.set(option.section, option.name, option.convert())
             else:
                 config.set(option.section, option.name, option.value)
 
-        if not config.has_section("unknown"):
+        if "unknown" not in sections:
             config.add_section("unknown")
         for unknown_option, value in self.unknown_options:
             config.set("unknown", unknown_option, value)
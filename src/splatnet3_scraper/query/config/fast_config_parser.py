@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import configparser
+import os
+import re
+from typing import IO
+
+_SECTION_RE = re.compile(r"\[(.+)\]")
+_KV_RE = re.compile(r"(.*?)\s*[=:]\s*(.*)$")
+_COMMENT_PREFIXES = ("#", ";")
+
+
+class FastConfigParser:
+    """A minimal, regex-based replacement for ``configparser.ConfigParser``.
+
+    The configuration files used by this library are flat ``[section]`` and
+    ``key = value`` files, so the full state machine of the standard library
+    parser is not needed. This class parses a file in a single pass using two
+    precompiled regular expressions and stores the result as a plain dictionary
+    of dictionaries, which makes every subsequent lookup a simple dictionary
+    access. Option names are lowercased to match the behavior of
+    ``configparser``, and no interpolation is performed on the values.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a ``FastConfigParser`` object with no sections."""
+        self._sections: dict[str, dict[str, str]] = {}
+
+    def __getitem__(self, section: str) -> dict[str, str]:
+        return self._sections[section]
+
+    def __contains__(self, section: object) -> bool:
+        return section in self._sections
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def read(
+        self,
+        path: str | os.PathLike[str],
+        encoding: str | None = None,
+    ) -> list[str]:
+        """Reads and parses a configuration file. Like ``configparser``, a file
+        that does not exist is silently ignored.
+
+        Args:
+            path (str | os.PathLike[str]): The path to the file to read.
+            encoding (str | None): The encoding of the file. Defaults to None.
+
+        Returns:
+            list[str]: The list of paths that were successfully read.
+        """
+        try:
+            with open(path, "r", encoding=encoding) as f:
+                self.read_file(f)
+        except OSError:
+            return []
+        return [os.fspath(path)]
+
+    def read_file(self, f: IO[str], source: str | None = None) -> None:
+        """Parses a configuration from an open file object. Like
+        ``configparser``, a value continues onto the following lines as long
+        as they are indented deeper than its key, and a section or option that
+        is defined twice in the same file is an error.
+
+        Args:
+            f (IO[str]): The file object to read from.
+            source (str | None): The name of the file, used in error messages.
+                If None, the name of the file object is used. Defaults to None.
+
+        Raises:
+            configparser.MissingSectionHeaderError: If an option is defined
+                before any section header.
+            configparser.DuplicateSectionError: If a section is defined twice.
+            configparser.DuplicateOptionError: If an option is defined twice
+                in the same section.
+            configparser.ParsingError: If any line cannot be parsed.
+        """
+        if source is None:
+            source = getattr(f, "name", "<???>")
+        added: set[str | tuple[str, str]] = set()
+        error: configparser.ParsingError | None = None
+        section_name = ""
+        section: dict[str, str] | None = None
+        key: str | None = None
+        lines: list[str] = []
+        indent = 0
+        for lineno, raw_line in enumerate(f, start=1):
+            line = raw_line.strip()
+            if line.startswith(_COMMENT_PREFIXES):
+                continue
+            if not line:
+                # Blank lines are kept inside multi-line values
+                if key is not None:
+                    lines.append("")
+                continue
+            line_indent = len(raw_line) - len(raw_line.lstrip())
+            if key is not None and line_indent > indent:
+                lines.append(line)
+                continue
+            if section is not None and key is not None:
+                section[key] = "\n".join(lines).rstrip()
+                key = None
+            indent = line_indent
+            if (match := _SECTION_RE.match(line)) is not None:
+                section_name = match.group(1)
+                if section_name in added:
+                    raise configparser.DuplicateSectionError(
+                        section_name, source, lineno
+                    )
+                added.add(section_name)
+                section = self._sections.setdefault(section_name, {})
+            elif section is None:
+                raise configparser.MissingSectionHeaderError(
+                    source, lineno, raw_line
+                )
+            elif (match := _KV_RE.match(line)) is not None and match.group(1):
+                key = match.group(1).lower()
+                if (section_name, key) in added:
+                    raise configparser.DuplicateOptionError(
+                        section_name, key, source, lineno
+                    )
+                added.add((section_name, key))
+                lines = [match.group(2)]
+            else:
+                # Like configparser, report every bad line at the end
+                if error is None:
+                    error = configparser.ParsingError(source)
+                error.append(lineno, repr(raw_line))
+        if section is not None and key is not None:
+            section[key] = "\n".join(lines).rstrip()
+        if error is not None:
+            raise error
+
+    def write(self, f: IO[str]) -> None:
+        """Writes the configuration to an open file object, using the same
+        layout as ``configparser``.
+
+        Args:
+            f (IO[str]): The file object to write to.
+        """
+        for section, options in self._sections.items():
+            f.write(f"[{section}]\n")
+            for key, value in options.items():
+                value = value.replace("\n", "\n\t")
+                f.write(f"{key} = {value}\n")
+            f.write("\n")
+
+    def sections(self) -> list[str]:
+        """The list of sections in the configuration.
+
+        Returns:
+            list[str]: The list of section names.
+        """
+        return list(self._sections)
+
+    def has_section(self, section: str) -> bool:
+        """Checks whether a section exists.
+
+        Args:
+            section (str): The name of the section.
+
+        Returns:
+            bool: True if the section exists, False otherwise.
+        """
+        return section in self._sections
+
+    def add_section(self, section: str) -> None:
+        """Adds an empty section.
+
+        Args:
+            section (str): The name of the section.
+
+        Raises:
+            ValueError: If the section already exists.
+        """
+        if section in self._sections:
+            raise ValueError(f"Section {section} already exists.")
+        self._sections[section] = {}
+
+    def remove_section(self, section: str) -> bool:
+        """Removes a section and all of its options.
+
+        Args:
+            section (str): The name of the section.
+
+        Returns:
+            bool: True if the section existed, False otherwise.
+        """
+        return self._sections.pop(section, None) is not None
+
+    def options(self, section: str) -> list[str]:
+        """The list of options in a section.
+
+        Args:
+            section (str): The name of the section.
+
+        Returns:
+            list[str]: The list of option names.
+        """
+        return list(self._sections[section])
+
+    def items(self, section: str, raw: bool = False) -> list[tuple[str, str]]:
+        """The list of option name and value pairs in a section.
+
+        Args:
+            section (str): The name of the section.
+            raw (bool): Accepted for compatibility with ``configparser``. No
+                interpolation is ever performed. Defaults to False.
+
+        Returns:
+            list[tuple[str, str]]: The list of option name and value pairs.
+        """
+        return list(self._sections[section].items())
+
+    def has_option(self, section: str, option: str) -> bool:
+        """Checks whether an option exists in a section.
+
+        Args:
+            section (str): The name of the section.
+            option (str): The name of the option.
+
+        Returns:
+            bool: True if the option exists, False otherwise.
+        """
+        return option.lower() in self._sections.get(section, {})
+
+    def get(self, section: str, option: str) -> str:
+        """Gets the value of an option.
+
+        Args:
+            section (str): The name of the section.
+            option (str): The name of the option.
+
+        Returns:
+            str: The value of the option.
+        """
+        return self._sections[section][option.lower()]
+
+    def set(self, section: str, option: str, value: str) -> None:
+        """Sets the value of an option in an existing section.
+
+        Args:
+            section (str): The name of the section.
+            option (str): The name of the option.
+            value (str): The value of the option.
+        """
+        self._sections[section][option.lower()] = value
+
+    def remove_option(self, section: str, option: str) -> bool:
+        """Removes an option from a section.
+
+        Args:
+            section (str): The name of the section.
+            option (str): The name of the option.
+
+        Returns:
+            bool: True if the option existed, False otherwise.
+        """
+        return self._sections[section].pop(option.lower(), None) is not None
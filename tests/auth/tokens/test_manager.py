@@ -1,9 +1,15 @@
+import pickle
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
-from splatnet3_scraper.auth.tokens.manager import ManagerOrigin, TokenManager
-from splatnet3_scraper.constants import TOKENS
+from splatnet3_scraper.auth.tokens.manager import (
+    ManagerOrigin,
+    TokenManager,
+    _as_url_list,
+)
+from splatnet3_scraper.auth.tokens.tokens import Token
+from splatnet3_scraper.constants import DEFAULT_F_TOKEN_URL, TOKENS
 
 ftoken_urls = [
     "ftoken_url_1",
@@ -110,6 +116,8 @@ class TestTokenManager:
             else:
                 mock_nso.new_instance.assert_called_once()
 
+            mock_env_manager.assert_not_called()
+            assert instance.env_manager == env_manager
             if with_env_manager:
                 mock_env_manager.assert_not_called()
             else:
@@ -122,7 +130,7 @@ class TestTokenManager:
 
             assert instance.nso == nso
             assert instance.f_token_url == expected_f_token_url
-            assert instance.env_manager == env_manager
+            assert instance.f_token_url is not f_token_url
             assert instance.keychain == mock_keychain.return_value
             assert instance.origin == mock_origin.return_value
 
@@ -131,6 +139,24 @@ class TestTokenManager:
                 "test_data" if with_origin_data else None,
             )
 
+    @pytest.mark.parametrize(
+        "f_token_url, expected",
+        [
+            (None, DEFAULT_F_TOKEN_URL),
+            (ftoken_urls[0], [ftoken_urls[0]]),
+            (ftoken_urls, ftoken_urls),
+            (tuple(ftoken_urls), ftoken_urls),
+        ],
+        ids=["none", "single_url", "list", "tuple"],
+    )
+    def test_as_url_list(
+        self, f_token_url: str | list[str] | None, expected: list[str]
+    ) -> None:
+        result = _as_url_list(f_token_url)
+        assert result == expected
+        assert result is not f_token_url
+        assert result is not DEFAULT_F_TOKEN_URL
+
     def test_flag_origin(self, mock_token_manager: TokenManager) -> None:
         mock_token_manager.flag_origin("test_origin", "test_data")
         assert isinstance(mock_token_manager.origin, ManagerOrigin)
@@ -189,6 +215,23 @@ class TestTokenManager:
         else:
             assert nso._session_token != token.value
 
+    def test_add_token_runtime_name(self) -> None:
+        nso = MagicMock()
+        nso.session_token = "test_session_token"
+        manager = TokenManager(nso=nso)
+        # Built at runtime, so not the same object as the literal
+        name = "".join(["g", "token"])
+        manager.add_token("test_gtoken", name)
+        assert nso._gtoken == "test_gtoken"
+
+    def test_add_token_unpickled(self) -> None:
+        nso = MagicMock()
+        nso.session_token = "test_session_token"
+        manager = TokenManager(nso=nso)
+        token = pickle.loads(pickle.dumps(Token("test_gtoken", "gtoken", 0)))
+        manager.add_token(token)
+        assert nso._gtoken == "test_gtoken"
+
     @pytest.mark.parametrize(
         "raise_exception",
         [True, False],
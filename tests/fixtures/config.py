@@ -54,7 +54,7 @@ def s3s_config() -> str:
 
 @pytest.fixture
 def all_config(all_path) -> configparser.ConfigParser:
-    config = configparser.ConfigParser()
+    config = configparser.ConfigParser(interpolation=None)
     config.read(all_path)
     return config
 
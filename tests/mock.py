@@ -1,4 +1,6 @@
 class MockResponse:
+    __slots__ = ("status_code", "text", "url", "_json")
+
     def __init__(
         self,
         status_code: int,
@@ -6,34 +8,14 @@ class MockResponse:
         json: dict = {},
         url: str = "",
     ) -> None:
-        self._status_code = status_code
-        self.status_code_counter = 0
-        self._text = text
-        self.text_counter = 0
+        self.status_code = status_code
+        self.text = text
         self._json = json
-        self.json_counter = 0
-        self._url = url
-        self.url_counter = 0
-
-    @property
-    def status_code(self):
-        self.status_code_counter += 1
-        return self._status_code
-
-    @property
-    def text(self):
-        self.text_counter += 1
-        return self._text
+        self.url = url
 
     def json(self):
-        self.json_counter += 1
         return self._json
 
-    @property
-    def url(self):
-        self.url_counter += 1
-        return self._url
-
 
 class MockNSO:
     def __init__(self) -> None:
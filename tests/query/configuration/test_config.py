@@ -1,5 +1,5 @@
 import configparser
-import json
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -42,7 +42,9 @@ class TestConfig:
         config = Config(mock_handler, token_manager=mock_token_manager)
         config.regenerate_tokens()
         mock_token_manager.regenerate_tokens.assert_called_once_with()
-        assert mock_handler.set_value.call_count == 3
+        assert [
+            call.args[0] for call in mock_handler.set_value.call_args_list
+        ] == [TOKENS.SESSION_TOKEN, TOKENS.GTOKEN, TOKENS.BULLET_TOKEN]
 
     @pytest.mark.parametrize(
         "token",
@@ -146,6 +148,7 @@ class TestConfig:
                 gtoken=mock_get.return_value,
                 bullet_token=mock_get.return_value,
                 prefix=expected_prefix,
+                handler=mock_handler.return_value,
             )
 
     @pytest.mark.parametrize(
@@ -191,6 +194,22 @@ class TestConfig:
                 token_manager=mock_token_manager,
             )
 
+    def test_from_tokens_existing_handler(self) -> None:
+        existing_handler = MagicMock()
+        with (
+            patch(base_config_path + ".ConfigOptionHandler") as mock_handler,
+            patch(base_config_path + ".TokenManagerConstructor"),
+        ):
+            config = Config.from_tokens(
+                "session_token",
+                gtoken="gtoken",
+                bullet_token="bullet_token",
+                handler=existing_handler,
+            )
+            mock_handler.assert_not_called()
+            assert config.handler is existing_handler
+            assert existing_handler.set_value.call_count == 3
+
     @pytest.mark.parametrize(
         "save_to_file",
         [
@@ -264,9 +283,7 @@ class TestConfig:
         expected_file_path = "test" if save_to_file else None
 
         with (
-            patch(
-                base_config_path + ".configparser.ConfigParser"
-            ) as mock_configparser,
+            patch(base_config_path + ".FastConfigParser") as mock_configparser,
             patch(base_config_path + ".ConfigOptionHandler") as mock_handler,
             patch(config_path + ".from_config_handler") as mock_config,
         ):
@@ -290,6 +307,92 @@ class TestConfig:
                 output_file_path=expected_file_path,
             )
 
+    def test_from_file_missing(self, tmp_path) -> None:
+        path = str(tmp_path / "missing")
+        with patch(config_path + ".from_config_handler") as mock_config:
+            Config.from_file(path)
+            handler = mock_config.call_args.args[0]
+            assert handler.unknown_options == []
+
+    class TestSaveToFile:
+        def test_no_file_path(self, valid: str) -> None:
+            config = Config.from_file(valid, save_to_file=False)
+            with pytest.raises(ValueError):
+                config.save_to_file()
+
+        def test_save(self, valid: str, tmp_path) -> None:
+            config = Config.from_file(valid, save_to_file=False)
+            path = tmp_path / "saved"
+            config.save_to_file(str(path))
+            saved = Config.from_file(str(path))
+            assert saved.tokens == config.tokens
+
+        def test_unchanged_not_rewritten(self, valid: str, tmp_path) -> None:
+            config = Config.from_file(valid, save_to_file=False)
+            path = tmp_path / "saved"
+            config.save_to_file(str(path))
+            with patch("builtins.open", wraps=open) as mock_open:
+                config.save_to_file(str(path))
+                modes = [call.args[1] for call in mock_open.call_args_list]
+            assert "w" not in modes
+
+            config.set_value("language", "ja-JP")
+            config.save_to_file(str(path))
+            with open(path, "r") as f:
+                assert "language = ja-JP" in f.read()
+
+        def test_undecodable_file(self, valid: str, tmp_path) -> None:
+            config = Config.from_file(valid, save_to_file=False)
+            path = tmp_path / "saved"
+            path.write_bytes(b"\xff\xfe garbage")
+            config.save_to_file(str(path))
+            saved = Config.from_file(str(path))
+            assert saved.tokens == config.tokens
+
+    class TestWriteAtomic:
+        def test_write(self, tmp_path) -> None:
+            path = tmp_path / "file"
+            Config._write_atomic(str(path), "content")
+            assert path.read_text() == "content"
+            assert path.stat().st_mode & 0o777 == 0o600
+            assert [p.name for p in tmp_path.iterdir()] == ["file"]
+
+        def test_preserves_mode(self, tmp_path) -> None:
+            path = tmp_path / "file"
+            path.write_text("old")
+            path.chmod(0o640)
+            sizes = []
+            chmod = os.chmod
+
+            def record_size(tmp_path: str, mode: int) -> None:
+                sizes.append(os.path.getsize(tmp_path))
+                chmod(tmp_path, mode)
+
+            with patch(base_config_path + ".os.chmod", side_effect=record_size):
+                Config._write_atomic(str(path), "new")
+            assert sizes == [0]
+            assert path.read_text() == "new"
+            assert path.stat().st_mode & 0o777 == 0o640
+
+        def test_symlink(self, tmp_path) -> None:
+            real = tmp_path / "real"
+            real.write_text("old")
+            link = tmp_path / "link"
+            link.symlink_to(real)
+            Config._write_atomic(str(link), "new")
+            assert link.is_symlink()
+            assert real.read_text() == "new"
+
+        def test_failure_cleans_up(self, tmp_path) -> None:
+            path = tmp_path / "file"
+            path.write_text("old")
+            with patch(base_config_path + ".os.replace") as mock_replace:
+                mock_replace.side_effect = OSError("test")
+                with pytest.raises(OSError):
+                    Config._write_atomic(str(path), "new")
+            assert path.read_text() == "old"
+            assert [p.name for p in tmp_path.iterdir()] == ["file"]
+
     class TestFromFileNoMock:
         def test_extra_tokens(self, extra_tokens: str) -> None:
             config = Config.from_file(
@@ -62,7 +62,9 @@ class TestConfigOptionHandler:
                     )
                 )
 
-        with patch(handler_path + ".OPTIONS", new=options):
+        with patch(
+            handler_path + "._iter_options", new=lambda self: iter(options)
+        ):
             handler = ConfigOptionHandler()
             option_reference = handler.build_option_reference()
 
@@ -109,7 +111,9 @@ class TestConfigOptionHandler:
             for i, x in enumerate(breaks)
             for j in range(x)
         ]
-        with patch(handler_path + ".OPTIONS", new=options):
+        with patch(
+            handler_path + "._iter_options", new=lambda self: iter(options)
+        ):
             handler = ConfigOptionHandler()
             # SECTIONS can be in any order, so sort them
             assert sorted(handler.SECTIONS) == [
@@ -186,8 +190,9 @@ class TestConfigOptionHandler:
         handler = ConfigOptionHandler()
         handler.option_reference = option_reference
         assert handler.get_option("test") == test_option
-        with pytest.raises(KeyError):
-            handler.get_option("invalid")
+        assert handler.get_option("TEST") == test_option
+        with pytest.raises(KeyError, match="Option invalid is not supported"):
+            handler.get_option("INVALID")
 
     def test_get_value(self) -> None:
         test_option = MagicMock()
@@ -216,57 +221,65 @@ class TestConfigOptionHandler:
             for i, x in enumerate(breaks)
             for j in range(x)
         ]
-        with patch(handler_path + ".OPTIONS", new=options):
+        with patch(
+            handler_path + "._iter_options", new=lambda self: iter(options)
+        ):
             handler = ConfigOptionHandler()
             assert handler.get_section("section_0") == options[:3]
             assert handler.get_section("section_1") == options[3:6]
             assert handler.get_section("section_2") == options[6:]
 
     def test_read_from_configparser(self) -> None:
-        count = 0
-
-        def mock_set_value(self, name: str) -> str:
-            nonlocal count
-            count += 1
-            if count == 1:
-                raise KeyError("test")
-            return name
-
         mock_configp = MagicMock()
-        mock_sections = [MagicMock()]
-        mock_options = [MagicMock(), MagicMock(), MagicMock()]
+        mock_sections = ["section_0", "section_1"]
+        mock_options = {
+            "section_0": [("unknown_0", "value_0"), ("Language", "value_1")],
+            "section_1": [("country", "value_2")],
+        }
         mock_configp.sections.return_value = mock_sections
-        mock_configp.options.return_value = mock_options
+        mock_configp.items.side_effect = lambda section, raw: mock_options[
+            section
+        ]
         with patch(handler_path + ".set_value") as mock_set:
-            mock_set.side_effect = mock_set_value
             handler = ConfigOptionHandler()
             handler.read_from_configparser(mock_configp)
             mock_configp.sections.assert_called_once_with()
-            mock_configp.options.assert_called_once_with(mock_sections[0])
-            assert mock_set.call_count == len(mock_options)
+            for section in mock_sections:
+                mock_configp.items.assert_any_call(section, raw=True)
+            assert mock_set.call_count == 2
+            mock_set.assert_any_call("Language", "value_1")
+            mock_set.assert_any_call("country", "value_2")
+            assert handler.unknown_options == [("unknown_0", "value_0")]
+
+    def test_read_from_configparser_no_interpolation(self) -> None:
+        config = configparser.ConfigParser()
+        config.read_string("[options]\nuser_agent = Agent%20Name\n")
+        handler = ConfigOptionHandler()
+        handler.read_from_configparser(config)
+        assert handler.get_value("user_agent") == "Agent%20Name"
 
     def test_read_from_dict(self) -> None:
         mock_dict = {
             "test_0": "test_0",
-            "test_1": "test_1",
-            "test_2": "test_2",
+            "language": "test_1",
+            "Country": "test_2",
         }
-        count = 0
-
-        def mock_set_value(self, name: str) -> str:
-            nonlocal count
-            count += 1
-            if count == 1:
-                raise KeyError("test")
-            return name
-
         with patch(handler_path + ".set_value") as mock_set:
-            mock_set.side_effect = mock_set_value
             handler = ConfigOptionHandler()
             handler.read_from_dict(mock_dict)
-            assert mock_set.call_count == len(mock_dict)
-            for key, value in mock_dict.items():
-                mock_set.assert_any_call(key, value)
+            assert mock_set.call_count == 2
+            mock_set.assert_any_call("language", "test_1")
+            mock_set.assert_any_call("Country", "test_2")
+            assert handler.unknown_options == [("test_0", "test_0")]
+
+    def test_read_from_dict_callback_error(self) -> None:
+        def raise_key_error(value: str | None) -> str:
+            raise KeyError("test")
+
+        handler = ConfigOptionHandler()
+        handler.get_option("language").callback = raise_key_error
+        with pytest.raises(KeyError):
+            handler.read_from_dict({"language": "test"})
 
     def test_save_to_configparser(
         self,
@@ -277,6 +290,7 @@ class TestConfigOptionHandler:
         handler = ConfigOptionHandler()
         handler.read_from_configparser(all_config)
         config = handler.save_to_configparser()
+        assert isinstance(config, configparser.ConfigParser)
         with open(temp_file, "w") as f:
             config.write(f)
 
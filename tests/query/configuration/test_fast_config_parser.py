@@ -0,0 +1,157 @@
+import configparser
+import io
+
+import pytest
+
+from splatnet3_scraper.query.config.fast_config_parser import FastConfigParser
+
+
+class TestFastConfigParser:
+    def test_init(self) -> None:
+        parser = FastConfigParser()
+        assert parser._sections == {}
+        assert parser.sections() == []
+
+    @pytest.mark.parametrize(
+        "fixture, text",
+        [
+            ("all_path", None),
+            ("extra_tokens", None),
+            ("no_data", None),
+            ("no_tokens_section", None),
+            ("valid", None),
+            ("valid_with_ftoken", None),
+            ("valid_with_ftoken_list", None),
+            ("expected_all", None),
+            (None, "[s]\n  a = 1\n  b = 2\n"),
+            (None, "[s]\na = 1\n  b = 2\n\n  c\n\nd = 3\n"),
+            (None, "[s]\n  a = 1\n    more\n  b = 2\n"),
+            (None, "[s] ; c\na = 1\n"),
+            (None, "[s]\na = 1\n[t]\na = 2\n"),
+        ],
+        ids=[
+            "all_path",
+            "extra_tokens",
+            "no_data",
+            "no_tokens_section",
+            "valid",
+            "valid_with_ftoken",
+            "valid_with_ftoken_list",
+            "expected_all",
+            "indented keys",
+            "blank lines in value",
+            "indented continuation",
+            "section comment",
+            "same key in two sections",
+        ],
+    )
+    def test_matches_configparser(
+        self,
+        fixture: str | None,
+        text: str | None,
+        request: pytest.FixtureRequest,
+        tmp_path,
+    ) -> None:
+        if fixture is not None:
+            path = request.getfixturevalue(fixture)
+        else:
+            path = str(tmp_path / "config.ini")
+            with open(path, "w") as f:
+                f.write(text)
+        expected = configparser.ConfigParser(interpolation=None)
+        expected.read(path)
+        parser = FastConfigParser()
+        assert parser.read(path) == [path]
+        assert parser.sections() == expected.sections()
+        for section in expected.sections():
+            assert parser[section] == dict(expected[section])
+
+    def test_read_missing_file(self, tmp_path) -> None:
+        parser = FastConfigParser()
+        assert parser.read(str(tmp_path / "missing")) == []
+        assert parser.sections() == []
+
+    def test_read_file(self) -> None:
+        parser = FastConfigParser()
+        parser.read_file(
+            io.StringIO(
+                "# comment\n"
+                "; other comment\n"
+                "[Section]\n"
+                "Key = value\n"
+                "colon: value: with colon\n"
+                "multi = first\n"
+                "    second\n"
+                "empty =\n"
+            )
+        )
+        assert parser["Section"] == {
+            "key": "value",
+            "colon": "value: with colon",
+            "multi": "first\nsecond",
+            "empty": "",
+        }
+
+    @pytest.mark.parametrize(
+        "text, exception",
+        [
+            ("key = value\n", configparser.MissingSectionHeaderError),
+            ("[section]\n[not a line\n", configparser.ParsingError),
+            ("[section]\n= value\n", configparser.ParsingError),
+            ("[section]\na = 1\nA = 2\n", configparser.DuplicateOptionError),
+            ("[section]\n[section]\n", configparser.DuplicateSectionError),
+        ],
+        ids=[
+            "no section",
+            "invalid line",
+            "empty key",
+            "duplicate option",
+            "duplicate section",
+        ],
+    )
+    def test_read_file_invalid(
+        self, text: str, exception: type[configparser.Error]
+    ) -> None:
+        with pytest.raises(exception):
+            configparser.ConfigParser().read_file(io.StringIO(text))
+        parser = FastConfigParser()
+        with pytest.raises(exception):
+            parser.read_file(io.StringIO(text))
+
+    def test_write(self, all_path: str) -> None:
+        parser = FastConfigParser()
+        parser.read(all_path)
+        expected = configparser.ConfigParser()
+        expected.read(all_path)
+
+        parser_out = io.StringIO()
+        expected_out = io.StringIO()
+        parser.write(parser_out)
+        expected.write(expected_out)
+        assert parser_out.getvalue() == expected_out.getvalue()
+
+    def test_section_methods(self) -> None:
+        parser = FastConfigParser()
+        parser.add_section("test")
+        assert parser.has_section("test")
+        assert "test" in parser
+        assert list(parser) == ["test"]
+        assert len(parser) == 1
+        with pytest.raises(ValueError):
+            parser.add_section("test")
+        assert parser.remove_section("test")
+        assert not parser.remove_section("test")
+        assert not parser.has_section("test")
+
+    def test_option_methods(self) -> None:
+        parser = FastConfigParser()
+        parser.add_section("test")
+        parser.set("test", "Key", "value")
+        assert parser.options("test") == ["key"]
+        assert parser.has_option("test", "KEY")
+        assert not parser.has_option("missing", "key")
+        assert parser.get("test", "key") == "value"
+        assert parser.items("test", raw=True) == [("key", "value")]
+        assert parser.remove_option("test", "key")
+        assert not parser.remove_option("test", "key")
+        assert parser.options("test") == []